@@ -6,11 +6,13 @@
 예시 YAML 설정 파일 (config.yaml):
 
 ---
-check_interval: 5               # 상태 체크 주기 (초)
-connection_timeout: 2           # pg_isready 체크 시 타임아웃 (초)
+check_interval: 5               # 상태 체크 및 프로모션 판단 주기 (초)
+leader_check_interval: 5        # leader(및 다음 후보, 비정상 노드) health check 주기 (초, 기본값 check_interval)
+replica_check_interval: 15      # 그 외 건강한 replica health check 주기 (초, 기본값 check_interval * 3)
+connection_timeout: 2           # health check 시 타임아웃 (초)
 promotion_cooldown: 30          # leader 프로모션 후 재프로모션까지 최소 대기 시간 (초)
 failback_enabled: true          # failback 수행 여부
-promotion_command: "psql -h {host} -p {port} -c \"SELECT pg_promote();\""
+# promotion_command를 생략하면 노드의 커넥션 풀 연결로 SELECT pg_promote()를 실행합니다.
 replication_command: "echo 'Reconfiguring replication for {name} to follow leader {leader_name} at {leader_host}:{leader_port}'"
 nodes:
   - name: node1
@@ -44,11 +46,17 @@ nodes:
 """
 
 import argparse
+import asyncio
 import logging
-import subprocess
+import re
+import shlex
+import string
 import time
 import sys
-import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Optional
 
 try:
     import yaml
@@ -56,30 +64,93 @@ except ImportError:
     print("PyYAML 모듈이 필요합니다. pip install pyyaml")
     sys.exit(1)
 
-# psycopg2 또는 psycopg (psycopg3) 임포트
+# LibYAML이 설치되어 있으면 C 구현 로더를 사용
 try:
-    import psycopg2
-    use_psycopg2 = True
+    from yaml import CSafeLoader as SafeLoader
 except ImportError:
-    try:
-        import psycopg  # psycopg3
-        use_psycopg2 = False
-    except ImportError:
-        print("psycopg2 또는 psycopg 모듈이 필요합니다. pip install psycopg2 (또는 pip install psycopg)")
-        sys.exit(1)
+    from yaml import SafeLoader
+
+# psycopg (psycopg3) 및 psycopg_pool 임포트
+try:
+    import psycopg  # psycopg3
+    from psycopg.conninfo import make_conninfo
+    from psycopg_pool import AsyncConnectionPool, PoolTimeout
+except ImportError:
+    print("psycopg 및 psycopg_pool 모듈이 필요합니다. pip install \"psycopg[pool]\"")
+    sys.exit(1)
+
+log = logging.getLogger(__name__)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    asctime의 초 단위 부분을 캐시하여, 같은 초에 기록되는 로그마다 strftime을 다시 호출하지 않습니다.
+    출력 형식은 기본 Formatter와 동일합니다.
+    """
+    cached_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self.cached_time
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self.cached_time = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+@dataclass(slots=True)
+class Node:
+    """
+    노드 설정과 실행 중 상태를 담습니다.
+    설정의 노드 항목은 시작 시 Node로 변환되며, dsn은 시작 시 한 번 계산되고 healthy/last_check_ts는 실행 중에만 갱신됩니다.
+    """
+    name: str
+    host: str
+    port: int
+    failover_order: int
+    role: str = "replica"
+    dbname: str = "postgres"
+    user: Optional[str] = None
+    password: Optional[str] = field(default=None, repr=False)
+    healthy: bool = field(default=False, init=False)
+    last_check_ts: float = field(default=float("-inf"), init=False)
+    dsn: str = field(default="", init=False, repr=False)
+
+
+# pg_promote()가 승격 완료를 기다리는 최대 시간 (초, PostgreSQL 기본값)
+PROMOTE_WAIT_SECONDS = 60
+
+# 명령 템플릿에서 사용할 수 있는 변수
+PROMOTION_FIELDS = {"name", "host", "port"}
+REPLICATION_FIELDS = {"name", "host", "port", "leader_name", "leader_host", "leader_port"}
+
+# 노드 이름별 커넥션 풀 (main()에서 생성)
+pools = {}
+
+# 작업(Task)별로 사용 중인 DB 연결 (제한 시간을 넘긴 작업의 연결을 즉시 닫기 위해 사용)
+task_connections = {}
+
+# 포기했지만 아직 정리 중인 health check/프로모션 작업 (참조를 유지해야 중간에 수거되지 않음)
+background_tasks = set()
+
+# 명령 stdout을 로그로 남길지 여부 (main()에서 로그 레벨에 따라 설정)
+capture_stdout = True
 
 
 def load_config(config_path=None):
     """
     YAML 파일에서 설정을 읽어옵니다.
     config_path가 None이면 기본 설정을 사용합니다.
+    SIGHUP 등으로 설정을 다시 읽는 경로에서도 호출될 수 있으므로, 가능하면 LibYAML 기반 로더로 파싱합니다.
     """
     default_config = {
         "check_interval": 5,
         "connection_timeout": 2,
         "promotion_cooldown": 30,
         "failback_enabled": True,
-        "promotion_command": "psql -h {host} -p {port} -c \"SELECT pg_promote();\"",
+        "promotion_command": None,
         "replication_command": "echo 'Reconfiguring replication for {name} to follow leader {leader_name} at {leader_host}:{leader_port}'",
         "nodes": [
             {"name": "node1", "host": "127.0.0.1", "port": 5432, "failover_order": 1, "role": "leader", "dbname": "postgres"},
@@ -88,121 +159,263 @@ def load_config(config_path=None):
         ]
     }
     if config_path is None:
-        logging.info("설정 파일 경로가 제공되지 않아 기본 설정을 사용합니다.")
-        return default_config
-
-    if not os.path.exists(config_path):
-        logging.error("설정 파일 %s 이(가) 존재하지 않습니다. 기본 설정을 사용합니다.", config_path)
+        log.info("설정 파일 경로가 제공되지 않아 기본 설정을 사용합니다.")
         return default_config
 
     try:
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-        logging.info("설정 파일 %s 로드 완료", config_path)
+            config = yaml.load(f, Loader=SafeLoader)
+        log.info("설정 파일 %s 로드 완료", config_path)
         return config
+    except (FileNotFoundError, PermissionError) as e:
+        log.error("설정 파일 %s 을(를) 열 수 없습니다 (%s). 기본 설정을 사용합니다.", config_path, e.strerror)
+        return default_config
     except Exception as e:
-        logging.error("설정 파일 로드 중 오류 발생: %s. 기본 설정을 사용합니다.", e)
+        log.error("설정 파일 로드 중 오류 발생: %s. 기본 설정을 사용합니다.", e)
         return default_config
 
 
-def health_check_with_psycopg(node, timeout):
+def build_dsn(node, timeout, keepalives_idle):
     """
-    psycopg2(또는 psycopg3)를 사용하여 해당 노드에 접속한 후 SELECT 1 쿼리를 실행합니다.
-    노드 설정에 dbname, user, password가 있을 경우 사용하며, 없으면 기본값을 적용합니다.
+    노드 설정으로부터 libpq 접속 문자열을 생성합니다.
+    user, password가 없는 노드는 해당 항목을 생략하며, 값은 make_conninfo가 필요한 경우 따옴표로 감쌉니다.
+    풀의 연결은 오래 유지되므로 TCP keepalive로 유휴 중 끊어진 연결을 감지하고,
+    전송한 데이터가 timeout 동안 ACK되지 않으면 tcp_user_timeout으로 연결을 끊습니다.
     """
-    dsn_params = {
-        "host": node.get("host"),
-        "port": node.get("port"),
-        "connect_timeout": timeout,
-        "dbname": node.get("dbname", "postgres")
-    }
-    if "user" in node:
-        dsn_params["user"] = node["user"]
-    if "password" in node:
-        dsn_params["password"] = node["password"]
-
+    return make_conninfo(host=node.host,
+                         port=node.port,
+                         connect_timeout=timeout,
+                         dbname=node.dbname,
+                         user=node.user,
+                         password=node.password,
+                         keepalives=1,
+                         keepalives_idle=max(1, int(keepalives_idle)),
+                         keepalives_interval=1,
+                         keepalives_count=3,
+                         tcp_user_timeout=int(timeout * 1000))
+
+
+@asynccontextmanager
+async def node_connection(node, timeout):
+    """
+    노드의 커넥션 풀에서 연결을 빌려 사용합니다.
+    노드가 끊겼다 돌아온 직후에는 풀이 지수 백오프로 재접속을 기다리느라 PoolTimeout이 날 수 있으므로,
+    이 경우 connect_timeout으로 제한된 직접 연결을 한 번 열어 노드의 실제 상태를 확인합니다.
+    사용 중인 연결은 task_connections에 등록되어, 제한 시간을 넘기면 abandon_task가 소켓을 닫을 수 있습니다.
+    """
+    pool = pools[node.name]
+    task = asyncio.current_task()
     try:
-        if use_psycopg2:
-            conn = psycopg2.connect(**dsn_params)
-        else:
-            conn = psycopg.connect(**dsn_params)
-        cur = conn.cursor()
-        cur.execute("SELECT 1;")
-        result = cur.fetchone()
-        cur.close()
-        conn.close()
-        if result and result[0] == 1:
-            return True
-        else:
-            logging.debug("SELECT 1 check failed for node %s", node.get("name"))
-            return False
-    except Exception as e:
-        logging.debug("psycopg health check failed for node %s: %s", node.get("name"), str(e))
-        return False
+        conn = await pool.getconn(timeout=timeout)
+    except PoolTimeout:
+        log.debug("노드 %s 커넥션 풀 대기 시간 초과. 직접 연결을 시도합니다.", node.name)
+        conn = await psycopg.AsyncConnection.connect(node.dsn, autocommit=True)
+        task_connections[task] = conn
+        try:
+            yield conn
+        finally:
+            task_connections.pop(task, None)
+            await conn.close()
+        return
+    task_connections[task] = conn
+    try:
+        yield conn
+    finally:
+        task_connections.pop(task, None)
+        await pool.putconn(conn)
 
 
-def check_node_health(node, timeout):
+def abandon_task(task):
     """
-    해당 노드에 대해 pg_isready 명령어를 사용하여 health check를 수행하고,
-    psycopg를 통해 SELECT 1 쿼리 결과까지 확인합니다.
+    제한 시간을 넘긴 작업이 사용 중인 DB 연결의 소켓을 즉시 닫고 작업을 취소합니다.
+    asyncio.wait_for와 달리 취소가 끝나기를 기다리지 않으므로, 취소 처리 중 서버 cancel 요청 등이
+    지연되어도 호출한 쪽은 막히지 않습니다. 닫힌 연결은 풀로 돌아갈 때 폐기됩니다.
+    """
+    conn = task_connections.pop(task, None)
+    if conn is not None:
+        conn.pgconn.finish()
+    task.cancel()
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+
+async def health_check_with_psycopg(node, timeout):
+    """
+    노드의 커넥션 풀에서 연결을 빌려 빈 쿼리를 실행합니다.
+    빈 쿼리는 planner를 거치지 않으므로 SELECT 1보다 가볍고, 예외가 없으면 건강한 것으로 판단합니다.
+    정상 상태에서는 같은 연결을 재사용하며, OperationalError 등으로 끊어진 연결은 풀이 폐기하고 다시 접속합니다.
+    전체 소요 시간은 호출하는 쪽(main)에서 제한합니다.
     """
-    host = node.get("host")
-    port = node.get("port")
-")
-    # pg_isready를 사용 (pg_isready가 PATH에 있어야 함)
-    cmd = f"pg_isready -h {host} -p {port} -t {timeout}"
     try:
-        result = subprocess.run(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode != 0:
-            logging.debug("pg_isready check failed for node %s: %s", node.get("name"), result.stdout.decode().strip())
-            return False
+        async with node_connection(node, timeout) as conn:
+            await conn.execute("")
+        return True
     except Exception as e:
-        logging.debug("pg_isready execution error for node %s: %s", node.get("name"), str(e))
+        log.debug("psycopg health check failed for node %s: %s", node.name, str(e))
         return False
 
-    # 추가로 psycopg를 통해 SELECT 1 실행 확인
-    return health_check_with_psycopg(node, timeout)
+
+async def check_node_health(node, timeout):
+    """
+    해당 노드에 대해 커넥션 풀을 통한 health check를 수행합니다.
+    매 주기마다 pg_isready 프로세스를 띄우거나 새로 접속하지 않고 풀의 연결을 재사용합니다.
+    """
+    return await health_check_with_psycopg(node, timeout)
+
+
+def compile_argument(argument, allowed_fields, template):
+    """
+    명령 인자 하나의 포맷 문자열을 파싱하여, 키워드 인자로 호출하면 완성된 인자 문자열을 반환하는 함수를 만듭니다.
+    allowed_fields에 없는 변수나 위치 인자({}, {0})가 있으면 실행 중이 아니라 시작 시 ValueError를 발생시킵니다.
+    속성 접근이나 포맷 지정자가 포함된 경우에는 str.format을 그대로 사용합니다.
+    """
+    parts = list(string.Formatter().parse(argument))
+    # 포맷 지정자 안의 중첩 변수({port:{width}})까지 포함하여 검사
+    fields = [name for _, name, _, _ in parts if name is not None]
+    fields += [name for _, _, spec, _ in parts if spec
+               for _, name, _, _ in string.Formatter().parse(spec) if name is not None]
+    for name in fields:
+        if re.split(r"[.\[]", name, maxsplit=1)[0] not in allowed_fields:
+            raise ValueError("알 수 없는 변수 {%s} (사용 가능: %s): %s"
+                             % (name, ", ".join(sorted(allowed_fields)), template))
+    if any(name is not None and (not name.isidentifier() or spec or conversion)
+           for _, name, spec, conversion in parts):
+        return argument.format
+
+    def render(**kwargs):
+        return "".join(literal + str(kwargs[name]) if name is not None else literal
+                       for literal, name, _, _ in parts)
+    return render
+
+
+def compile_template(template, allowed_fields):
+    """
+    명령 템플릿을 시작 시 한 번만 인자 목록으로 분리하고 각 인자를 compile_argument로 파싱하여,
+    키워드 인자로 호출하면 완성된 argv 리스트를 반환하는 함수를 만듭니다.
+    치환된 값은 다시 분리되지 않으므로, 공백이나 따옴표가 포함된 값도 항상 하나의 인자로 전달됩니다.
+    """
+    renderers = [compile_argument(argument, allowed_fields, template) for argument in shlex.split(template)]
+
+    def render(**kwargs):
+        return [render_argument(**kwargs) for render_argument in renderers]
+    return render
+
+
+def check_shell_syntax(template):
+    """
+    명령은 셸을 거치지 않고 실행되므로, 파이프/리다이렉션/명령 연결 같은 셸 연산자가 포함된 템플릿을 거부합니다.
+    셸 기능이 필요하면 sh -c '...' 형태로 명시적으로 감싸야 합니다.
+    posix=False로 토큰화하여 따옴표를 토큰에 남기므로, '|'나 '' 같은 따옴표 안의 인자는 연산자로 보지 않습니다.
+    """
+    lexer = shlex.shlex(template, posix=False, punctuation_chars=True)
+    lexer.whitespace_split = True
+    for token in lexer:
+        if token and set(token) <= set("();<>|&"):
+            raise ValueError("셸 연산자 '%s'는 지원되지 않습니다 (sh -c '...'로 감싸서 사용하세요): %s" % (token, template))
 
 
-def promote_node(node, promotion_command):
+async def run_command(argv, timeout=None):
     """
-    지정된 노드에 대해 promotion_command를 실행합니다.
-    promotion_command는 포맷팅 문자열로, {name}, {host}, {port} 등의 변수를 포함할 수 있습니다.
+    argv 리스트를 셸 없이 그대로 실행하고 (종료 코드, stdout, stderr)를 반환합니다.
+    capture_stdout이 False이면 stdout은 버려지고 빈 문자열이 반환됩니다.
+    timeout이 주어지면 그 시간 안에 끝나지 않은 프로세스를 kill하고 회수한 뒤 asyncio.TimeoutError를 발생시킵니다.
     """
-    cmd = promotion_command.format(name=node.get("name"),
-                                   host=node.get("host"),
-                                   port=node.get("port"))
-    logging.info("노드 %s에 대해 프로모션 명령 실행: %s", node.get("name"), cmd)
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE)
     try:
-        result = subprocess.run(cmd, shell=True, check=True,
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        logging.info("프로모션 명령 성공: %s", result.stdout.decode().strip())
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    # 로케일에 따라 UTF-8이 아닌 출력이 나올 수 있으므로, 이미 끝난 명령의 결과를 디코딩 오류로 뒤집지 않음
+    return (process.returncode,
+            (stdout or b"").decode(errors="replace").strip(),
+            stderr.decode(errors="replace").strip())
+
+
+async def call_pg_promote(node, timeout):
+    """
+    노드의 연결로 SELECT pg_promote()를 실행하고 결과(bool)를 반환합니다.
+    """
+    async with node_connection(node, timeout) as conn:
+        cur = await conn.execute("SELECT pg_promote(true, %s)", (PROMOTE_WAIT_SECONDS,))
+        return (await cur.fetchone())[0]
+
+
+async def promote_node(node, promotion_format, timeout):
+    """
+    지정된 노드에 대해 프로모션 명령을 실행합니다.
+    promotion_format은 compile_template으로 만든 함수로, {name}, {host}, {port} 등의 변수를 채워 argv를 만듭니다.
+    promotion_format이 없으면 프로세스를 띄우지 않고 노드의 커넥션 풀 연결로 SELECT pg_promote()를 실행합니다.
+    timeout은 풀에서 연결을 기다리는 최대 시간이며, pg_promote()는 서버의 승격 대기 시간(wait_seconds)에
+    연결 대기 시간을 더한 시간 안에 끝나지 않으면 연결을 닫고 실패로 처리합니다.
+    """
+    if not promotion_format:
+        log.info("노드 %s에 대해 pg_promote() 실행", node.name)
+        task = asyncio.create_task(call_pg_promote(node, timeout))
+        done, _ = await asyncio.wait({task}, timeout=PROMOTE_WAIT_SECONDS + timeout * 2)
+        if not done:
+            abandon_task(task)
+            log.error("프로모션 실패 (노드 %s): pg_promote()가 제한 시간 안에 끝나지 않았습니다.", node.name)
+            return False
+        try:
+            promoted = task.result()
+        except Exception as e:
+            log.error("프로모션 실패 (노드 %s): %s", node.name, str(e))
+            return False
+        if not promoted:
+            log.error("프로모션 실패 (노드 %s): pg_promote()가 false를 반환했습니다.", node.name)
+            return False
+        log.info("프로모션 성공 (노드 %s)", node.name)
         return True
-    except subprocess.CalledProcessError as e:
-        logging.error("프로모션 명령 실패 (노드 %s): %s", node.get("name"), e.stderr.decode().strip())
+
+    argv = promotion_format(name=node.name, host=node.host, port=node.port)
+    log.info("노드 %s에 대해 프로모션 명령 실행: %s", node.name, shlex.join(argv))
+    try:
+        returncode, stdout, stderr = await run_command(argv)
+    except (OSError, ValueError) as e:
+        log.error("프로모션 명령 실행 오류 (노드 %s): %s", node.name, str(e))
+        return False
+    if returncode != 0:
+        log.error("프로모션 명령 실패 (노드 %s): %s", node.name, stderr)
         return False
+    log.info("프로모션 명령 성공: %s", stdout)
+    return True
 
 
-def reconfigure_replication(new_leader, node, replication_command):
+async def reconfigure_replication(new_leader, node, replication_format, timeout):
     """
     복제 재구성 명령을 실행합니다.
-    replication_command는 포맷팅 문자열로, {name}, {leader_name}, {leader_host}, {leader_port} 등을 포함할 수 있습니다.
-    """
-    cmd = replication_command.format(
-        name=node.get("name"),
-        host=node.get("host"),
-        port=node.get("port"),
-        leader_name=new_leader.get("name"),
-        leader_host=new_leader.get("host"),
-        leader_port=new_leader.get("port")
+    replication_format은 compile_template으로 만든 함수로, {name}, {leader_name}, {leader_host}, {leader_port} 등을 채워 argv를 만듭니다.
+    명령은 셸을 거치지 않고 직접 실행되며, timeout 안에 끝나지 않으면 프로세스를 종료합니다.
+    """
+    if not replication_format:
+        log.debug("복제 재구성 명령이 설정되지 않아 노드 %s를 건너뜁니다.", node.name)
+        return
+    argv = replication_format(
+        name=node.name,
+        host=node.host,
+        port=node.port,
+        leader_name=new_leader.name,
+        leader_host=new_leader.host,
+        leader_port=new_leader.port
     )
-    logging.info("노드 %s 복제 재구성 명령 실행: %s", node.get("name"), cmd)
+    log.info("노드 %s 복제 재구성 명령 실행: %s", node.name, shlex.join(argv))
     try:
-        result = subprocess.run(cmd, shell=True, check=True,
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        logging.info("복제 재구성 명령 성공 (노드 %s): %s", node.get("name"), result.stdout.decode().strip())
-    except subprocess.CalledProcessError as e:
-        logging.error("복제 재구성 명령 실패 (노드 %s): %s", node.get("name"), e.stderr.decode().strip())
+        returncode, stdout, stderr = await run_command(argv, timeout)
+    except asyncio.TimeoutError:
+        log.error("복제 재구성 명령이 %s초 안에 끝나지 않아 종료했습니다 (노드 %s).", timeout, node.name)
+        return
+    except (OSError, ValueError) as e:
+        log.error("복제 재구성 명령 실행 오류 (노드 %s): %s", node.name, str(e))
+        return
+    if returncode != 0:
+        log.error("복제 재구성 명령 실패 (노드 %s): %s", node.name, stderr)
+    else:
+        log.info("복제 재구성 명령 성공 (노드 %s): %s", node.name, stdout)
 
 
 def update_roles(nodes, new_leader_name):
@@ -210,37 +423,50 @@ def update_roles(nodes, new_leader_name):
     새 leader를 기준으로 각 노드의 역할을 업데이트합니다.
     """
     for node in nodes:
-        if node.get("name") == new_leader_name:
-            node["role"] = "leader"
+        if node.name == new_leader_name:
+            node.role = "leader"
         else:
-            node["role"] = "replica"
+            node.role = "replica"
 
 
 def get_current_leader(nodes):
     """
     현재 역할이 leader로 지정된 노드를 반환합니다.
-    만약 여러 leader가 있다면 failover_order가 가장 낮은 노드를 반환합니다.
+    nodes는 failover_order 순으로 정렬되어 있으므로, 여러 leader가 있다면 failover_order가 가장 낮은 노드가 반환됩니다.
     """
-    leaders = [node for node in nodes if node.get("role") == "leader"]
-    if not leaders:
-        return None
-    # failover_order가 낮은 순서대로 정렬
-    leaders.sort(key=lambda n: n.get("failover_order", 9999))
-    return leaders[0]
+    return next((node for node in nodes if node.role == "leader"), None)
 
 
 def get_best_candidate(nodes):
     """
     건강한 노드 중 failover_order가 가장 낮은 노드를 반환합니다.
+    nodes는 failover_order 순으로 정렬되어 있어야 합니다.
     """
-    healthy_nodes = [node for node in nodes if node.get("healthy")]
-    if not healthy_nodes:
-        return None
-    healthy_nodes.sort(key=lambda n: n.get("failover_order", 9999))
-    return healthy_nodes[0]
+    return next((node for node in nodes if node.healthy), None)
 
 
-def main():
+def get_nodes_to_check(nodes, current_time, check_interval, leader_check_interval, replica_check_interval):
+    """
+    이번 주기에 실제로 health check를 수행할 노드 목록을 반환합니다.
+    역할이 바뀔 수 있는 노드(현재 leader, leader를 제외한 최우선 후보)와 비정상 노드는 leader_check_interval마다,
+    그 외 건강한 replica는 replica_check_interval마다 확인하고, 그 사이에는 캐시된 healthy 값을 재사용합니다.
+    주기 지연에 의한 오차를 감안해 check_interval의 10%만큼 일찍 도래한 것으로 봅니다.
+    """
+    current_leader = get_current_leader(nodes)
+    next_candidate = next((node for node in nodes if node is not current_leader and node.healthy), None)
+    nodes_to_check = []
+    for node in nodes:
+        if node is current_leader or node is next_candidate or not node.healthy:
+            interval = leader_check_interval
+        else:
+            interval = replica_check_interval
+        next_check_ts = node.last_check_ts + interval
+        if next_check_ts <= current_time + check_interval * 0.1:
+            nodes_to_check.append(node)
+    return nodes_to_check
+
+
+async def main():
     parser = argparse.ArgumentParser(description="간단한 PostgreSQL replication 관리 도구")
     parser.add_argument("-c", "--config", help="YAML 설정 파일 경로", default=None)
     parser.add_argument("-l", "--log-level", help="로그 레벨 (DEBUG, INFO, WARNING, ERROR)", default="INFO")
@@ -251,91 +477,154 @@ def main():
     if not isinstance(numeric_level, int):
         print("잘못된 로그 레벨: %s" % args.log_level)
         sys.exit(1)
-    logging.basicConfig(level=numeric_level, format="%(asctime)s [%(levelname)s] %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(CachedTimeFormatter("%(asctime)s [%(levelname)s] %(message)s"))
+    logging.basicConfig(level=numeric_level, handlers=[handler])
+
+    # INFO 로그가 출력되지 않으면 명령 stdout을 버퍼링하지 않고 버림
+    global capture_stdout
+    capture_stdout = log.isEnabledFor(logging.INFO)
 
     config = load_config(args.config)
 
     check_interval = config.get("check_interval", 5)
+    leader_check_interval = config.get("leader_check_interval", check_interval)
+    replica_check_interval = config.get("replica_check_interval", check_interval * 3)
     connection_timeout = config.get("connection_timeout", 2)
     promotion_cooldown = config.get("promotion_cooldown", 30)
     failback_enabled = config.get("failback_enabled", True)
     promotion_command = config.get("promotion_command")
     replication_command = config.get("replication_command")
+    try:
+        for command in (promotion_command, replication_command):
+            if command:
+                check_shell_syntax(command)
+        promotion_format = compile_template(promotion_command, PROMOTION_FIELDS) if promotion_command else None
+        replication_format = compile_template(replication_command, REPLICATION_FIELDS) if replication_command else None
+    except ValueError as e:
+        log.error("명령 포맷 문자열 오류: %s. 종료합니다.", e)
+        sys.exit(1)
     nodes = config.get("nodes", [])
 
     if not nodes:
-        logging.error("노드 설정이 없습니다. 종료합니다.")
+        log.error("노드 설정이 없습니다. 종료합니다.")
+        sys.exit(1)
+
+    try:
+        nodes = [Node(**node) for node in nodes]
+    except TypeError as e:
+        log.error("노드 설정 오류: %s. 종료합니다.", e)
         sys.exit(1)
 
-    last_promotion_time = 0
-
-    logging.info("서비스 시작. 주기적으로 노드 상태를 체크합니다.")
-    while True:
-        current_time = time.time()
-
-        # 각 노드의 건강 상태 업데이트
-        for node in nodes:
-            healthy = check_node_health(node, connection_timeout)
-            node["healthy"] = healthy
-            status = "건강" if healthy else "비정상"
-            logging.debug("노드 %s (%s:%s) 상태: %s",
-                          node.get("name"), node.get("host"), node.get("port"), status)
-
-        # 현재 leader 확인
-        current_leader = get_current_leader(nodes)
-        if current_leader:
-            if current_leader.get("healthy"):
-                logging.debug("현재 leader는 %s", current_leader.get("name"))
+    # failover_order는 실행 중 바뀌지 않으므로 한 번만 정렬
+    nodes.sort(key=attrgetter("failover_order"))
+
+    for node in nodes:
+        node.dsn = build_dsn(node, connection_timeout, check_interval)
+        pools[node.name] = AsyncConnectionPool(node.dsn, kwargs={"autocommit": True},
+                                               min_size=1, max_size=2,
+                                               timeout=connection_timeout,
+                                               name=node.name, open=False)
+        await pools[node.name].open()
+
+    try:
+        # 경과 시간 계산은 시스템 시계 변경(NTP 등)의 영향을 받지 않는 monotonic 시계를 사용
+        last_promotion_time = time.monotonic() - promotion_cooldown
+        next_tick = time.monotonic()
+
+        log.info("서비스 시작. 주기적으로 노드 상태를 체크합니다.")
+        while True:
+            current_time = time.monotonic()
+
+            # 확인이 필요한 노드의 건강 상태를 하나의 이벤트 루프에서 동시에 확인한 뒤 업데이트
+            nodes_to_check = get_nodes_to_check(nodes, current_time, check_interval,
+                                                leader_check_interval, replica_check_interval)
+            for node in nodes_to_check:
+                log.debug("노드 %s health check 수행", node.name)
+            # 풀 대기, 직접 연결, 쿼리가 각각 connection_timeout을 쓸 수 있으므로 그 합으로 제한하고,
+            # 그 안에 끝나지 않은 확인은 연결을 닫고 포기한 뒤 비정상으로 처리
+            check_tasks = {asyncio.create_task(check_node_health(node, connection_timeout)): node
+                           for node in nodes_to_check}
+            pending = set()
+            if check_tasks:
+                _, pending = await asyncio.wait(check_tasks, timeout=connection_timeout * 3)
+            for task, node in check_tasks.items():
+                if task in pending:
+                    abandon_task(task)
+                    log.debug("노드 %s health check 시간 초과", node.name)
+                    healthy = False
+                else:
+                    healthy = task.result()
+                node.healthy = healthy
+                node.last_check_ts = current_time
+                if log.isEnabledFor(logging.DEBUG):
+                    status = "건강" if healthy else "비정상"
+                    log.debug("노드 %s (%s:%s) 상태: %s",
+                              node.name, node.host, node.port, status)
+
+            # 현재 leader 확인
+            current_leader = get_current_leader(nodes)
+            if current_leader:
+                if current_leader.healthy:
+                    log.debug("현재 leader는 %s", current_leader.name)
+                else:
+                    log.warning("현재 leader %s가 비정상입니다.", current_leader.name)
             else:
-                logging.warning("현재 leader %s가 비정상입니다.", current_leader.get("name"))
-        else:
-            logging.warning("현재 leader가 지정되어 있지 않습니다.")
+                log.warning("현재 leader가 지정되어 있지 않습니다.")
 
-        # 건강한 노드 중 failover_order가 가장 낮은 노드를 찾음
-        best_candidate = get_best_candidate(nodes)
+            # 건강한 노드 중 failover_order가 가장 낮은 노드를 찾음
+            best_candidate = get_best_candidate(nodes)
 
-        promotion_needed = False
-        reason = ""
+            promotion_needed = False
+            reason = ""
 
-        if not current_leader or not current_leader.get("healthy"):
-            if best_candidate:
-                promotion_needed = True
-                reason = "현재 leader 비정상"
+            if not current_leader or not current_leader.healthy:
+                if best_candidate:
+                    promotion_needed = True
+                    reason = "현재 leader 비정상"
+                else:
+                    log.error("모든 노드가 비정상입니다. 프로모션 불가")
             else:
-                logging.error("모든 노드가 비정상입니다. 프로모션 불가")
-        else:
-            # failback: 현재 leader보다 우선순위가 더 높은 건강한 노드가 존재하는 경우
-            if failback_enabled and best_candidate:
-                if best_candidate.get("failover_order") < current_leader.get("failover_order"):
-                    if current_time - last_promotion_time >= promotion_cooldown:
-                        promotion_needed = True
-                        reason = "failback: 우선순위가 더 높은 노드가 건강함"
-                    else:
-                        logging.debug("프로모션 쿨다운 중 (남은 시간: %s초)",
+                # failback: 현재 leader보다 우선순위가 더 높은 건강한 노드가 존재하는 경우
+                if failback_enabled and best_candidate:
+                    if best_candidate.failover_order < current_leader.failover_order:
+                        if current_time - last_promotion_time >= promotion_cooldown:
+                            promotion_needed = True
+                            reason = "failback: 우선순위가 더 높은 노드가 건강함"
+                        elif log.isEnabledFor(logging.DEBUG):
+                            log.debug("프로모션 쿨다운 중 (남은 시간: %s초)",
                                       promotion_cooldown - (current_time - last_promotion_time))
-        if promotion_needed and best_candidate:
-            logging.info("프로모션 시작 (사유: %s). 후보 노드: %s", reason, best_candidate.get("name"))
-            success = promote_node(best_candidate, promotion_command)
-            if success:
-                # 역할 업데이트
-                update_roles(nodes, best_candidate.get("name"))
-                last_promotion_time = current_time
-
-                # 다른 노드들에 대해 복제 재구성 실행
-                for node in nodes:
-                    if node.get("name") != best_candidate.get("name") and node.get("healthy"):
-                        reconfigure_replication(best_candidate, node, replication_command)
+            if promotion_needed and best_candidate:
+                log.info("프로모션 시작 (사유: %s). 후보 노드: %s", reason, best_candidate.name)
+                success = await promote_node(best_candidate, promotion_format, connection_timeout)
+                if success:
+                    # 역할 업데이트
+                    update_roles(nodes, best_candidate.name)
+                    last_promotion_time = current_time
+
+                    # 다른 노드들에 대해 복제 재구성을 동시에 실행
+                    # (명령마다 connection_timeout * 2로 제한되어, 멈춘 명령은 종료되고 다음 주기로 넘어가지 않음)
+                    targets = [node for node in nodes
+                               if node.name != best_candidate.name and node.healthy]
+                    await asyncio.gather(*(reconfigure_replication(best_candidate, node, replication_format,
+                                                                   connection_timeout * 2)
+                                           for node in targets))
+                else:
+                    log.error("프로모션 실패. 다음 체크 주기까지 대기합니다.")
             else:
-                logging.error("프로모션 실패. 다음 체크 주기까지 대기합니다.")
-        else:
-            logging.debug("프로모션 불필요: 현재 leader 유지")
+                log.debug("프로모션 불필요: 현재 leader 유지")
 
-        time.sleep(check_interval)
+            # 체크에 소요된 시간만큼 대기 시간을 줄여 주기가 밀리지 않도록 함
+            next_tick += check_interval
+            await asyncio.sleep(max(0, next_tick - time.monotonic()))
+    finally:
+        for pool in pools.values():
+            await pool.close()
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
-        logging.info("프로그램 종료됨 (KeyboardInterrupt)")
+        log.info("프로그램 종료됨 (KeyboardInterrupt)")
         sys.exit(0)